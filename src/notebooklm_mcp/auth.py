@@ -4,14 +4,21 @@ Uses Chrome DevTools MCP to extract auth tokens from an authenticated browser se
 If the user is not logged in, prompts them to log in via the Chrome window.
 """
 
+import functools
 import json
 import os
+import re
+import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+# Default cookie age before is_expired() reports True (1 week)
+DEFAULT_MAX_AGE_HOURS = 168
+
+
+@dataclass(slots=True)
 class AuthTokens:
     """Authentication tokens for NotebookLM.
 
@@ -40,7 +47,7 @@ class AuthTokens:
             extracted_at=data.get("extracted_at", 0),
         )
 
-    def is_expired(self, max_age_hours: float = 168) -> bool:
+    def is_expired(self, max_age_hours: float = DEFAULT_MAX_AGE_HOURS) -> bool:
         """Check if cookies are older than max_age_hours.
 
         Default is 168 hours (1 week) since cookies are stable for weeks.
@@ -55,8 +62,13 @@ class AuthTokens:
         return "; ".join(f"{k}={v}" for k, v in self.cookies.items())
 
 
+@functools.lru_cache(maxsize=1)
 def get_cache_path() -> Path:
-    """Get the path to the auth cache file."""
+    """Get the path to the auth cache file.
+
+    The result is cached for the life of the process; call
+    get_cache_path.cache_clear() if HOME changes (e.g. in tests).
+    """
     cache_dir = Path.home() / ".notebooklm-mcp"
     cache_dir.mkdir(exist_ok=True)
     return cache_dir / "auth.json"
@@ -97,8 +109,25 @@ def save_tokens_to_cache(tokens: AuthTokens, silent: bool = False) -> None:
         silent: If True, don't print confirmation message (for auto-updates)
     """
     cache_path = get_cache_path()
-    with open(cache_path, "w") as f:
-        json.dump(tokens.to_dict(), f, indent=2)
+    # The directory is only created on the first (cached) get_cache_path call
+    cache_path.parent.mkdir(exist_ok=True)
+    # Write to a unique temp file (created 0600 by mkstemp, since it holds
+    # session cookies), fsync it, then os.replace it over auth.json. An
+    # interrupted save leaves either the old or the new file, never a mix,
+    # and concurrent savers never share a temp file.
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix="auth.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(tokens.to_dict(), f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
     if not silent:
         print(f"Auth tokens cached to {cache_path}")
 
@@ -130,22 +159,49 @@ def extract_tokens_via_chrome_devtools() -> AuthTokens | None:
     )
 
 
+# Patterns tried in order for the CSRF token
+_CSRF_PATTERNS = (
+    re.compile(r'"SNlM0e":"([^"]+)"'),  # WIZ_global_data.SNlM0e
+    re.compile(r'at=([^&"]+)'),  # Direct at= value
+    re.compile(r'"FdrFJe":"([^"]+)"'),  # Alternative location
+)
+
+# Patterns tried in order for the session ID
+_SESSION_ID_PATTERNS = (
+    re.compile(r'"FdrFJe":"([^"]+)"'),
+    re.compile(r'f\.sid=(\d+)'),
+)
+
+
+def _find_quoted_value(html: str, marker: str) -> str | None:
+    """Return the string value following the first occurrence of marker.
+
+    Fast path for literal keys like '"SNlM0e":"' - str.find is much cheaper
+    than a regex scan over the large WIZ_global_data page. Returns None if the
+    marker is missing or its value is empty/unterminated, so callers can fall
+    back to the full pattern list.
+    """
+    start = html.find(marker)
+    if start == -1:
+        return None
+    start += len(marker)
+    end = html.find('"', start)
+    if end > start:
+        return html[start:end]
+    return None
+
+
 def extract_csrf_from_page_source(html: str) -> str | None:
     """Extract CSRF token from page HTML.
 
     The token is stored in WIZ_global_data.SNlM0e or similar structures.
     """
-    import re
+    token = _find_quoted_value(html, '"SNlM0e":"')
+    if token:
+        return token
 
-    # Try different patterns for CSRF token
-    patterns = [
-        r'"SNlM0e":"([^"]+)"',  # WIZ_global_data.SNlM0e
-        r'at=([^&"]+)',  # Direct at= value
-        r'"FdrFJe":"([^"]+)"',  # Alternative location
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, html)
+    for pattern in _CSRF_PATTERNS:
+        match = pattern.search(html)
         if match:
             return match.group(1)
 
@@ -154,15 +210,12 @@ def extract_csrf_from_page_source(html: str) -> str | None:
 
 def extract_session_id_from_page(html: str) -> str | None:
     """Extract session ID from page HTML."""
-    import re
-
-    patterns = [
-        r'"FdrFJe":"([^"]+)"',
-        r'f\.sid=(\d+)',
-    ]
+    session_id = _find_quoted_value(html, '"FdrFJe":"')
+    if session_id:
+        return session_id
 
-    for pattern in patterns:
-        match = re.search(pattern, html)
+    for pattern in _SESSION_ID_PATTERNS:
+        match = pattern.search(html)
         if match:
             return match.group(1)
 
@@ -191,22 +244,19 @@ def extract_session_id_from_page(html: str) -> str | None:
 
 def parse_cookies_from_chrome_format(cookies_list: list[dict]) -> dict[str, str]:
     """Parse cookies from Chrome DevTools format to simple dict."""
-    result = {}
-    for cookie in cookies_list:
-        name = cookie.get("name", "")
-        value = cookie.get("value", "")
-        if name:
-            result[name] = value
-    return result
+    return {
+        name: cookie.get("value", "")
+        for cookie in cookies_list
+        if (name := cookie.get("name"))  # Skip cookies with no/empty name
+    }
 
 
 # Tokens that need to be present for auth to work
-REQUIRED_COOKIES = ["SID", "HSID", "SSID", "APISID", "SAPISID"]
+REQUIRED_COOKIES = frozenset({"SID", "HSID", "SSID", "APISID", "SAPISID"})
 
 
 def validate_cookies(cookies: dict[str, str]) -> bool:
     """Check if required cookies are present."""
-    for required in REQUIRED_COOKIES:
-        if required not in cookies:
-            return False
-    return True
+    # dict_keys >= frozenset checks each required name against the dict
+    # without building a temporary set from all cookies
+    return cookies.keys() >= REQUIRED_COOKIES
@@ -421,7 +421,7 @@ def run_auth_flow(port: int = CDP_DEFAULT_PORT, auto_launch: bool = True) -> Aut
 
     if not validate_cookies(cookies):
         print("ERROR: Missing required cookies. Please ensure you're fully logged in.")
-        print(f"Required: {REQUIRED_COOKIES}")
+        print(f"Required: {sorted(REQUIRED_COOKIES)}")
         print(f"Found: {list(cookies.keys())}")
         return None
 
@@ -577,7 +577,7 @@ def run_file_cookie_entry(cookie_file: str | None = None) -> AuthTokens | None:
     # Validate required cookies
     if not validate_cookies(cookies):
         print("\nWARNING: Some required cookies are missing!")
-        print(f"Required: {REQUIRED_COOKIES}")
+        print(f"Required: {sorted(REQUIRED_COOKIES)}")
         print(f"Found: {list(cookies.keys())}")
         print()
         print("Continuing anyway...")